@@ -5,9 +5,12 @@ Tests all API endpoints with proper authentication and data validation
 """
 
 import requests
+import os
 import sys
 import json
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
 class CRMLeiritrixTester:
@@ -23,6 +26,11 @@ class CRMLeiritrixTester:
             'users': [],
             'sales': []
         }
+        # Supabase project used by the frontend (PostgREST + Auth)
+        self.supabase_url = os.environ.get('VITE_SUPABASE_URL', '').rstrip('/')
+        self.supabase_anon_key = os.environ.get('VITE_SUPABASE_ANON_KEY', '')
+        self.supabase_token = None
+        self.supabase_user_id = None
 
     def log(self, message: str, level: str = "INFO"):
         """Log test messages with timestamp"""
@@ -92,6 +100,49 @@ class CRMLeiritrixTester:
             })
             return False, {}
 
+    def supabase_configured(self) -> bool:
+        """Check the Supabase env vars are set, logging a skip otherwise"""
+        if self.supabase_url and self.supabase_anon_key:
+            return True
+        self.log("⚠️ VITE_SUPABASE_URL / VITE_SUPABASE_ANON_KEY not set, skipping Supabase test")
+        return False
+
+    def supabase_login(self) -> bool:
+        """Sign in with Supabase Auth so PostgREST calls run as a real user (RLS applies)"""
+        if self.supabase_token:
+            return True
+
+        response = requests.post(
+            f"{self.supabase_url}/auth/v1/token",
+            params={'grant_type': 'password'},
+            headers={'apikey': self.supabase_anon_key, 'Content-Type': 'application/json'},
+            json={
+                'email': os.environ.get('SUPABASE_TEST_EMAIL', 'admin@leiritrix.com'),
+                'password': os.environ.get('SUPABASE_TEST_PASSWORD', 'Admin123!@#')
+            },
+            timeout=30
+        )
+        if response.status_code != 200:
+            self.log(f"❌ Supabase login failed - Status: {response.status_code}")
+            return False
+
+        body = response.json()
+        self.supabase_token = body['access_token']
+        self.supabase_user_id = body['user']['id']
+        return True
+
+    def rest_get(self, path: str, params: Optional[Dict] = None) -> tuple:
+        """GET a PostgREST resource as the signed-in user, returning (response, seconds)"""
+        headers = {
+            'apikey': self.supabase_anon_key,
+            'Authorization': f'Bearer {self.supabase_token}'
+        }
+        started = time.perf_counter()
+        response = requests.get(
+            f"{self.supabase_url}/rest/v1/{path}", params=params, headers=headers, timeout=30
+        )
+        return response, time.perf_counter() - started
+
     def test_system_initialization(self) -> bool:
         """Test system initialization"""
         self.log("=== Testing System Initialization ===")
@@ -261,6 +312,114 @@ class CRMLeiritrixTester:
         
         return success
 
+    def test_sale_detail_aggregate(self) -> bool:
+        """Compare the PostgREST requests SaleDetail used to send with the single getSaleDetail select"""
+        self.log("=== Testing Sale Detail Aggregate ===")
+        if not self.supabase_configured():
+            return True
+        if not self.supabase_login():
+            return False
+
+        response, _ = self.rest_get('sales', {'select': 'id', 'order': 'created_at.desc', 'limit': 1})
+        if response.status_code != 200 or not response.json():
+            self.log("⚠️ No sales to test aggregate detail")
+            return True
+        sale_filter = f"eq.{response.json()[0]['id']}"
+
+        # Before: the four requests SaleDetail fired in parallel on open
+        # (salesService.getSaleById, partnersService.getPartners,
+        # usersService.getUsersByRole, operatorsService.getOperators)
+        parallel = [
+            ('sales', {
+                'select': '*,operators:operator_id(id,name,commission_visible_to_bo),'
+                          'partners:partner_id(id,name),users:seller_id(id,name)',
+                'id': sale_filter
+            }),
+            ('partners', {'select': '*,partner_operators(operator_id)', 'active': 'eq.true', 'order': 'name.asc'}),
+            ('users', {'select': '*', 'role': 'eq.vendedor', 'active': 'eq.true', 'order': 'name.asc'}),
+            ('operators', {'select': '*,partner_operators(partner_id)', 'active': 'eq.true', 'order': 'name.asc'})
+        ]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(parallel)) as executor:
+            results = list(executor.map(lambda req: self.rest_get(*req), parallel))
+        before_time = time.perf_counter() - started
+
+        # The client's other contracts are new on the detail page; a separate
+        # NIF lookup is what it would cost without the embed
+        sale = results[0][0].json()[0] if results[0][0].status_code == 200 and results[0][0].json() else {}
+        nif_time = None
+        if sale.get('client_nif'):
+            _, nif_time = self.rest_get('sales', {
+                'select': 'id,client_name,category,sale_type,status,sale_date,created_at,'
+                          'loyalty_end_date,operators:operator_id(id,name)',
+                'client_nif': f"eq.{sale['client_nif']}",
+                'id': f"neq.{sale['id']}",
+                'order': 'created_at.desc',
+                'limit': 6
+            })
+
+        # After: salesService.getSaleDetail with every relation, client_contracts included
+        self.tests_run += 1
+        response, after_time = self.rest_get('sales', {
+            'select': '*,operators:operator_id(id,name,commission_visible_to_bo),'
+                      'partners:partner_id(id,name),users:seller_id(id,name),'
+                      'operator_client_categories:client_category_id(id,name),'
+                      'client_contracts(id,client_name,category,sale_type,status,sale_date,'
+                      'created_at,loyalty_end_date,operators:operator_id(id,name))',
+            'id': sale_filter,
+            # Same cap as getSaleDetail (CLIENT_CONTRACTS_LIMIT + 1)
+            'client_contracts.order': 'created_at.desc',
+            'client_contracts.limit': 6
+        })
+        detail = response.json()[0] if response.status_code == 200 and response.json() else {}
+        missing = [f for f in ['id', 'operators', 'partners', 'users', 'operator_client_categories', 'client_contracts']
+                   if f not in detail]
+        if missing:
+            self.log(f"❌ Aggregate detail - Status: {response.status_code}, missing: {missing}")
+            self.failed_tests.append({
+                'name': 'Sale Detail Aggregate',
+                'error': f"status {response.status_code}, missing {missing}",
+                'endpoint': 'rest/v1/sales?select=...client_contracts(...)',
+                'method': 'GET'
+            })
+            return False
+        if len(detail['client_contracts']) > 6:
+            self.log(f"❌ client_contracts not limited: {len(detail['client_contracts'])} rows")
+            self.failed_tests.append({
+                'name': 'Sale Detail Aggregate (contracts limit)',
+                'error': f"{len(detail['client_contracts'])} embedded contracts",
+                'endpoint': 'rest/v1/sales?client_contracts.limit=6',
+                'method': 'GET'
+            })
+            return False
+
+        self.tests_passed += 1
+        self.log(f"   Before: {len(parallel)} requests, {before_time * 1000:.0f}ms")
+        self.log(f"   After: 1 request, {after_time * 1000:.0f}ms (client contracts included)")
+        if nif_time is not None:
+            self.log(f"   Client contracts as a separate NIF lookup: +1 request, {nif_time * 1000:.0f}ms")
+
+        # Field selection: only the requested columns and relations come back
+        self.tests_run += 1
+        response, _ = self.rest_get('sales', {
+            'select': 'id,client_name,partners:partner_id(id,name)',
+            'id': sale_filter
+        })
+        narrowed = response.json()[0] if response.status_code == 200 and response.json() else {}
+        if set(narrowed) != {'id', 'client_name', 'partners'}:
+            self.log(f"❌ Field selection not applied to aggregate detail: {sorted(narrowed)}")
+            self.failed_tests.append({
+                'name': 'Sale Detail Aggregate (field selection)',
+                'error': f"got fields {sorted(narrowed)}",
+                'endpoint': 'rest/v1/sales?select=id,client_name,partners(...)',
+                'method': 'GET'
+            })
+            return False
+
+        self.tests_passed += 1
+        self.log("✅ Aggregate detail and field selection OK")
+        return True
+
     def test_update_sale_status(self) -> bool:
         """Test updating sale status"""
         if not self.created_resources['sales']:
@@ -662,6 +821,90 @@ class CRMLeiritrixTester:
         
         return False
 
+    def test_notifications_delta_polling(self, clients: int = 200) -> bool:
+        """Test many idle clients polling the notifications delta query and unread counter concurrently"""
+        self.log("=== Testing Notifications Delta Polling ===")
+        if not self.supabase_configured():
+            return True
+        if not self.supabase_login():
+            return False
+
+        user_filter = f"eq.{self.supabase_user_id}"
+
+        # Same request as notificationsService.getUnreadCount
+        response, _ = self.rest_get('notification_counters', {
+            'select': 'unread_count',
+            'user_id': user_filter
+        })
+        if response.status_code != 200:
+            self.log(f"❌ Unread counter read failed - Status: {response.status_code}")
+            return False
+
+        # Idle client cursor: newest notification the bell already holds
+        response, _ = self.rest_get('notifications', {
+            'select': 'created_at',
+            'user_id': user_filter,
+            'order': 'created_at.desc',
+            'limit': 1
+        })
+        if response.status_code != 200:
+            self.log(f"❌ Cursor lookup failed - Status: {response.status_code}")
+            return False
+        latest = response.json()
+        cursor = latest[0]['created_at'] if latest else datetime.now(timezone.utc).isoformat()
+
+        # Same requests as notificationsService.getNotificationsSince + getUnreadCount
+        delta_params = {
+            'select': '*',
+            'user_id': user_filter,
+            'created_at': f"gte.{cursor}",
+            'order': 'created_at.desc',
+            'limit': 100
+        }
+        counter_params = {'select': 'unread_count', 'user_id': user_filter}
+
+        baseline, _ = self.rest_get('notifications', delta_params)
+        expected_rows = len(baseline.json()) if baseline.status_code == 200 else 0
+
+        def poll(_):
+            try:
+                delta, delta_time = self.rest_get('notifications', delta_params)
+                counter, counter_time = self.rest_get('notification_counters', counter_params)
+                rows = len(delta.json()) if delta.status_code == 200 else None
+                ok = delta.status_code == 200 and counter.status_code == 200
+                return ok, rows, max(delta_time, counter_time)
+            except Exception as e:
+                return False, str(e), 0.0
+
+        self.tests_run += 1
+        self.log(f"Testing {clients} concurrent delta polls...")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            results = list(executor.map(poll, range(clients)))
+        elapsed = time.perf_counter() - started
+
+        failures = [r for r in results if not r[0]]
+        # Idle clients may only get back rows sharing the cursor timestamp (gte), never new ones
+        non_idle = [r for r in results if r[0] and r[1] != expected_rows]
+        latencies = sorted(r[2] for r in results)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+
+        self.log(f"   {clients} clients x 2 requests in {elapsed:.2f}s, p95 latency {p95 * 1000:.0f}ms")
+
+        if failures or non_idle:
+            self.log(f"❌ Delta polling - {len(failures)} failed, {len(non_idle)} returned unexpected rows")
+            self.failed_tests.append({
+                'name': 'Notifications Delta Polling',
+                'error': f"{len(failures)} failed, {len(non_idle)} unexpected deltas",
+                'endpoint': 'rest/v1/notifications?created_at=gte.',
+                'method': 'GET'
+            })
+            return False
+
+        self.tests_passed += 1
+        self.log("✅ No idle client received new rows")
+        return True
+
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all tests and return results"""
         self.log("🚀 Starting CRM Leiritrix API Testing Suite")
@@ -678,6 +921,7 @@ class CRMLeiritrixTester:
             self.test_create_sale,
             self.test_list_sales,
             self.test_get_sale_detail,
+            self.test_sale_detail_aggregate,
             self.test_update_sale_status,
             self.test_assign_commission,
             self.test_create_user,
@@ -692,7 +936,8 @@ class CRMLeiritrixTester:
             self.test_telecom_sale,
             self.test_sales_filtering,
             self.test_sale_edit_restrictions,
-            self.test_user_edit_delete
+            self.test_user_edit_delete,
+            self.test_notifications_delta_polling
         ]
         
         # Run tests
@@ -0,0 +1,154 @@
+import fs from 'fs'
+import path from 'path'
+import { gzipSync } from 'zlib'
+
+// Size and startup budgets checked on every `vite build`. The initial bundle
+// is what the Login screen downloads before it becomes usable; route chunks
+// are downloaded on navigation (or on hover, see prefetchRoute in src/routes.jsx).
+const BUDGETS = {
+  initialGzipKb: 250,
+  routeGzipKb: 150,
+  ttiMs: 5000,
+}
+
+// Rough low-end Android profile (Slow 4G, Moto G4 class CPU) used to turn
+// bytes into an estimated time-to-interactive.
+const LOW_END_PROFILE = {
+  name: 'Low-end Android / Slow 4G',
+  rttMs: 150,
+  downloadKbps: 1600,
+  parseMsPerKb: 1.5,
+}
+
+const kb = (bytes) => bytes / 1024
+
+const estimateTti = (gzipBytes, rawJsBytes) => {
+  const { rttMs, downloadKbps, parseMsPerKb } = LOW_END_PROFILE
+  // HTML round trip + entry assets round trip, then transfer and parse/compile
+  const network = 2 * rttMs + (gzipBytes * 8) / downloadKbps
+  const cpu = kb(rawJsBytes) * parseMsPerKb
+  return Math.round(network + cpu)
+}
+
+function collectStaticGraph(bundle, fileName, seen = new Set()) {
+  if (seen.has(fileName)) return seen
+  const chunk = bundle[fileName]
+  if (!chunk || chunk.type !== 'chunk') return seen
+  seen.add(fileName)
+  chunk.imports.forEach((dep) => collectStaticGraph(bundle, dep, seen))
+  return seen
+}
+
+function measure(bundle, fileNames) {
+  let raw = 0
+  let rawJs = 0
+  let gzip = 0
+  const files = new Set(fileNames)
+
+  for (const fileName of fileNames) {
+    const chunk = bundle[fileName]
+    chunk.viteMetadata?.importedCss?.forEach((css) => files.add(css))
+  }
+
+  for (const fileName of files) {
+    const output = bundle[fileName]
+    if (!output) continue
+    const source = output.type === 'chunk' ? output.code : output.source
+    const size = Buffer.byteLength(source)
+    raw += size
+    gzip += gzipSync(source).length
+    if (output.type === 'chunk') rawJs += size
+  }
+
+  return { files: Array.from(files), raw, rawJs, gzip }
+}
+
+export default function bundleBudget() {
+  // `vite build --mode budget` (npm run build:budget) fails on overruns
+  let strict = false
+  // Written next to vite.config.js, not into dist/, which is deployed as-is
+  let reportPath = null
+  let report = null
+
+  return {
+    name: 'leiritrix-bundle-budget',
+    apply: 'build',
+
+    configResolved(config) {
+      strict = config.mode === 'budget'
+      reportPath = path.resolve(config.root, 'bundle-report.json')
+    },
+
+    generateBundle(_, bundle) {
+      const chunks = Object.values(bundle).filter((o) => o.type === 'chunk')
+      const entry = chunks.find((c) => c.isEntry)
+      if (!entry) return
+
+      const initialFiles = collectStaticGraph(bundle, entry.fileName)
+      const initial = measure(bundle, initialFiles)
+      const initialTti = estimateTti(initial.gzip, initial.rawJs)
+
+      const routes = chunks
+        .filter((c) => c.isDynamicEntry)
+        .map((chunk) => {
+          const files = [...collectStaticGraph(bundle, chunk.fileName)].filter(
+            (f) => !initialFiles.has(f)
+          )
+          const size = measure(bundle, files)
+          return {
+            chunk: chunk.name,
+            gzipKb: +kb(size.gzip).toFixed(1),
+            rawKb: +kb(size.raw).toFixed(1),
+            estimatedTtiMs: estimateTti(initial.gzip + size.gzip, initial.rawJs + size.rawJs),
+          }
+        })
+        .sort((a, b) => b.gzipKb - a.gzipKb)
+
+      const violations = []
+      if (kb(initial.gzip) > BUDGETS.initialGzipKb) {
+        violations.push(`initial bundle ${kb(initial.gzip).toFixed(1)} KB gzip > ${BUDGETS.initialGzipKb} KB`)
+      }
+      if (initialTti > BUDGETS.ttiMs) {
+        violations.push(`estimated startup TTI ${initialTti} ms > ${BUDGETS.ttiMs} ms`)
+      }
+      routes
+        .filter((r) => r.gzipKb > BUDGETS.routeGzipKb)
+        .forEach((r) => violations.push(`chunk ${r.chunk} ${r.gzipKb} KB gzip > ${BUDGETS.routeGzipKb} KB`))
+
+      report = {
+        generatedAt: new Date().toISOString(),
+        profile: LOW_END_PROFILE,
+        budgets: BUDGETS,
+        initial: {
+          files: initial.files,
+          gzipKb: +kb(initial.gzip).toFixed(1),
+          rawKb: +kb(initial.raw).toFixed(1),
+          estimatedTtiMs: initialTti,
+        },
+        routes,
+        violations,
+      }
+
+      console.log(`\nBundle budget (${LOW_END_PROFILE.name})`)
+      console.log(
+        `  initial: ${report.initial.gzipKb} KB gzip / ${report.initial.rawKb} KB raw, ` +
+          `estimated TTI ${initialTti} ms`
+      )
+      console.table(routes)
+
+      if (violations.length > 0) {
+        const message = `Bundle budget exceeded:\n  - ${violations.join('\n  - ')}`
+        if (strict) {
+          this.error(message)
+        }
+        this.warn(message)
+      }
+    },
+
+    closeBundle() {
+      if (!report) return
+      fs.writeFileSync(reportPath, JSON.stringify(report, null, 2))
+      console.log(`  report: ${path.relative(process.cwd(), reportPath)}`)
+    },
+  }
+}
@@ -1,6 +1,373 @@
-const CACHE_NAME = "leiritrix-v1";
+const CACHE_NAME = "leiritrix-v2";
 const STATIC_ASSETS = ["/", "/manifest.json", "/leiritrix.png", "/favicon.png"];
 
+// --- API read cache -------------------------------------------------------
+// Stale-while-revalidate cache for Supabase REST GETs, stored in IndexedDB.
+// Entries are scoped per user (JWT `sub`), expire per resource, are evicted
+// LRU once the store grows past API_CACHE_MAX_ENTRIES / API_CACHE_MAX_BYTES,
+// and are invalidated whenever the app writes to a table they depend on.
+
+const API_CACHE_DB = "leiritrix-api-cache";
+// Small per-entry records (size, ages, tables) kept apart from the response
+// bodies so eviction and invalidation never have to read the bodies.
+const API_CACHE_META_STORE = "meta";
+const API_CACHE_BODY_STORE = "bodies";
+const API_CACHE_MAX_ENTRIES = 300;
+const API_CACHE_MAX_BYTES = 8 * 1024 * 1024;
+// Past this age an entry is only served when the network is unavailable
+const API_CACHE_MAX_STALE = 24 * 60 * 60 * 1000;
+
+const MINUTE = 60 * 1000;
+const API_CACHE_DEFAULT_TTL = 1 * MINUTE;
+const API_CACHE_TTL = {
+  partners: 10 * MINUTE,
+  operators: 10 * MINUTE,
+  partner_operators: 10 * MINUTE,
+  operator_client_categories: 10 * MINUTE,
+  operator_commission_settings: 10 * MINUTE,
+  operator_commission_rules: 10 * MINUTE,
+  power_commission_values: 10 * MINUTE,
+  users: 5 * MINUTE,
+  backups: 5 * MINUTE,
+  notification_preferences: 5 * MINUTE,
+  sales: 1 * MINUTE,
+  leads: 1 * MINUTE,
+};
+// Kept live by realtime / delta sync, never served from cache
+const API_CACHE_EXCLUDED = new Set(["notifications", "notification_counters"]);
+// Edge functions that write to the database and must flush the cache
+const API_CACHE_WRITE_FUNCTIONS = new Set(["recalculate-commissions"]);
+
+const apiCacheStats = { hits: 0, stale: 0, misses: 0, offline: 0 };
+const apiRevalidations = new Map();
+// Bumped on every invalidation so a fetch that started before a write can
+// tell its response is outdated and must not be stored.
+const apiInvalidations = new Map();
+let apiCacheClears = 0;
+let apiCacheDbPromise = null;
+
+function openApiCacheDb() {
+  if (!apiCacheDbPromise) {
+    apiCacheDbPromise = new Promise((resolve, reject) => {
+      const request = indexedDB.open(API_CACHE_DB, 2);
+      request.onupgradeneeded = () => {
+        const db = request.result;
+        if (db.objectStoreNames.contains("responses")) {
+          db.deleteObjectStore("responses");
+        }
+        const meta = db.createObjectStore(API_CACHE_META_STORE, { keyPath: "key" });
+        meta.createIndex("lastAccess", "lastAccess");
+        meta.createIndex("tables", "tables", { multiEntry: true });
+        db.createObjectStore(API_CACHE_BODY_STORE, { keyPath: "key" });
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => {
+        apiCacheDbPromise = null;
+        reject(request.error);
+      };
+    });
+  }
+  return apiCacheDbPromise;
+}
+
+function idbRequest(request) {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+async function apiCacheTx(stores, mode, fn) {
+  const db = await openApiCacheDb();
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(stores, mode);
+    let result;
+    Promise.resolve(fn(tx)).then((r) => {
+      result = r;
+    }, reject);
+    tx.oncomplete = () => resolve(result);
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+const ALL_STORES = [API_CACHE_META_STORE, API_CACHE_BODY_STORE];
+
+function getRestTable(url) {
+  const match = url.pathname.match(/\/rest\/v1\/([^/]+)/);
+  return match ? match[1] : null;
+}
+
+// Embedded resources in `select=*,partners:partner_id(name)` also make the
+// entry depend on those tables; both alias and target are recorded.
+function getDependentTables(url, table) {
+  const tables = new Set([table]);
+  const select = url.searchParams.get("select") || "";
+  for (const match of select.matchAll(/(\w+)(?::(\w+))?(?:!\w+)?\(/g)) {
+    tables.add(match[1]);
+    if (match[2]) tables.add(match[2]);
+  }
+  return Array.from(tables);
+}
+
+function getRequestUserId(request) {
+  const auth = request.headers.get("Authorization") || "";
+  const token = auth.replace(/^Bearer\s+/i, "");
+  try {
+    const payload = token.split(".")[1].replace(/-/g, "+").replace(/_/g, "/");
+    return JSON.parse(atob(payload)).sub || null;
+  } catch (e) {
+    return null;
+  }
+}
+
+function getApiCacheKey(request, userId) {
+  const h = request.headers;
+  return [userId, h.get("Accept") || "", h.get("Prefer") || "", h.get("Range") || "", request.url].join("|");
+}
+
+function getInvalidationVersion(tables) {
+  return [apiCacheClears, ...tables.map((t) => apiInvalidations.get(t) || 0)].join(":");
+}
+
+function buildCachedResponse(entry, state) {
+  const headers = new Headers(entry.headers);
+  headers.set("X-SW-Cache", state);
+  return new Response(entry.body, { status: entry.status, headers });
+}
+
+async function readApiCache(key) {
+  try {
+    return await apiCacheTx(ALL_STORES, "readwrite", async (tx) => {
+      const metaStore = tx.objectStore(API_CACHE_META_STORE);
+      const meta = await idbRequest(metaStore.get(key));
+      if (!meta) return null;
+
+      const body = await idbRequest(tx.objectStore(API_CACHE_BODY_STORE).get(key));
+      if (!body) return null;
+
+      meta.lastAccess = Date.now();
+      metaStore.put(meta);
+      return { ...meta, ...body };
+    });
+  } catch (e) {
+    return null;
+  }
+}
+
+async function writeApiCache({ key, userId, tables, status, headers, body }, isCurrent) {
+  try {
+    const now = Date.now();
+    await apiCacheTx(ALL_STORES, "readwrite", (tx) => {
+      // Checked as the transaction is created: IndexedDB runs readwrite
+      // transactions in order, so a later invalidation still deletes this.
+      if (!isCurrent()) return;
+      tx.objectStore(API_CACHE_META_STORE).put({
+        key,
+        userId,
+        tables,
+        size: body.length,
+        storedAt: now,
+        lastAccess: now,
+      });
+      tx.objectStore(API_CACHE_BODY_STORE).put({ key, status, headers, body });
+    });
+    await evictApiCache();
+  } catch (e) {
+    console.error("API cache write failed:", e);
+  }
+}
+
+async function evictApiCache() {
+  await apiCacheTx(ALL_STORES, "readwrite", async (tx) => {
+    const metaStore = tx.objectStore(API_CACHE_META_STORE);
+    const bodyStore = tx.objectStore(API_CACHE_BODY_STORE);
+    const entries = await idbRequest(metaStore.getAll());
+    let count = entries.length;
+    let bytes = entries.reduce((sum, e) => sum + e.size, 0);
+    if (count <= API_CACHE_MAX_ENTRIES && bytes <= API_CACHE_MAX_BYTES) return;
+
+    entries.sort((a, b) => a.lastAccess - b.lastAccess);
+    for (const entry of entries) {
+      if (count <= API_CACHE_MAX_ENTRIES && bytes <= API_CACHE_MAX_BYTES) break;
+      metaStore.delete(entry.key);
+      bodyStore.delete(entry.key);
+      count -= 1;
+      bytes -= entry.size;
+    }
+  });
+}
+
+async function invalidateApiCache(tables) {
+  // In-flight fetches may predate the write; later reads must not join them
+  apiRevalidations.clear();
+  if (tables) {
+    tables.forEach((t) => apiInvalidations.set(t, (apiInvalidations.get(t) || 0) + 1));
+  } else {
+    apiCacheClears += 1;
+  }
+
+  try {
+    await apiCacheTx(ALL_STORES, "readwrite", async (tx) => {
+      const metaStore = tx.objectStore(API_CACHE_META_STORE);
+      const bodyStore = tx.objectStore(API_CACHE_BODY_STORE);
+      if (!tables) {
+        metaStore.clear();
+        bodyStore.clear();
+        return;
+      }
+      const index = metaStore.index("tables");
+      for (const table of tables) {
+        const keys = await idbRequest(index.getAllKeys(table));
+        keys.forEach((key) => {
+          metaStore.delete(key);
+          bodyStore.delete(key);
+        });
+      }
+    });
+  } catch (e) {
+    console.error("API cache invalidation failed:", e);
+  }
+}
+
+async function getApiCacheStats() {
+  const entries = await apiCacheTx([API_CACHE_META_STORE], "readonly", (tx) =>
+    idbRequest(tx.objectStore(API_CACHE_META_STORE).getAll())
+  );
+  return {
+    ...apiCacheStats,
+    entries: entries.length,
+    bytes: entries.reduce((sum, e) => sum + e.size, 0),
+  };
+}
+
+// Resolves to { response, stored }: the network response is available as soon
+// as it arrives, and `stored` settles once the cache write (and eviction) has
+// finished, so callers can hand it to event.waitUntil instead of waiting on it.
+function fetchAndStore(request, key, userId, table, url) {
+  let pending = apiRevalidations.get(key);
+
+  if (!pending) {
+    const tables = getDependentTables(url, table);
+    const version = getInvalidationVersion(tables);
+
+    pending = fetch(request).then((response) => {
+      // Skipped if a write invalidated these tables while we were fetching:
+      // the body may predate it and must not come back as a fresh hit.
+      const stored = response.ok
+        ? response
+            .clone()
+            .text()
+            .then((body) =>
+              writeApiCache(
+                {
+                  key,
+                  userId,
+                  tables,
+                  status: response.status,
+                  headers: Array.from(response.headers.entries()),
+                  body,
+                },
+                () => getInvalidationVersion(tables) === version
+              )
+            )
+            .catch(() => {})
+        : Promise.resolve();
+      return { response, stored };
+    });
+
+    // Identical reads keep joining this fetch until its body is in the cache
+    apiRevalidations.set(key, pending);
+    pending
+      .then(({ stored }) => stored, () => {})
+      .finally(() => {
+        if (apiRevalidations.get(key) === pending) apiRevalidations.delete(key);
+      });
+  }
+
+  // Every caller gets its own copy; a body can only be consumed once
+  return pending.then(({ response, stored }) => ({ response: response.clone(), stored }));
+}
+
+async function handleApiRead(event, url, table, userId) {
+  const request = event.request;
+  const key = getApiCacheKey(request, userId);
+  const entry = await readApiCache(key);
+  const ttl = API_CACHE_TTL[table] ?? API_CACHE_DEFAULT_TTL;
+  const age = entry ? Date.now() - entry.storedAt : Infinity;
+
+  if (entry && age < ttl) {
+    apiCacheStats.hits += 1;
+    return buildCachedResponse(entry, "hit");
+  }
+
+  if (entry && age < API_CACHE_MAX_STALE) {
+    apiCacheStats.stale += 1;
+    event.waitUntil(
+      fetchAndStore(request.clone(), key, userId, table, url)
+        .then(({ stored }) => stored)
+        .catch(() => {})
+    );
+    return buildCachedResponse(entry, "stale");
+  }
+
+  apiCacheStats.misses += 1;
+  try {
+    const { response, stored } = await fetchAndStore(request.clone(), key, userId, table, url);
+    event.waitUntil(stored);
+    return response;
+  } catch (e) {
+    if (!entry) throw e;
+    apiCacheStats.offline += 1;
+    return buildCachedResponse(entry, "offline");
+  }
+}
+
+async function handleApiWrite(request, table) {
+  const response = await fetch(request);
+  if (response.ok) {
+    // RPCs and edge functions may touch any table, so drop everything
+    const isTableWrite = table && table !== "rpc";
+    await invalidateApiCache(isTableWrite ? [table] : null);
+  }
+  return response;
+}
+
+function handleSupabaseRequest(event, url) {
+  const request = event.request;
+  const functionName = url.pathname.match(/\/functions\/v1\/([^/]+)/)?.[1];
+  const table = functionName ? null : getRestTable(url);
+
+  if (request.method !== "GET" && request.method !== "HEAD") {
+    if (table || API_CACHE_WRITE_FUNCTIONS.has(functionName)) {
+      event.respondWith(handleApiWrite(request, table));
+    }
+    return;
+  }
+
+  if (request.method !== "GET" || !table || table === "rpc" || API_CACHE_EXCLUDED.has(table)) {
+    return;
+  }
+
+  const userId = getRequestUserId(request);
+  if (!userId) return;
+
+  event.respondWith(handleApiRead(event, url, table, userId));
+}
+
+self.addEventListener("message", (event) => {
+  const { type, tables } = event.data || {};
+  const reply = (payload) => event.ports[0]?.postMessage(payload);
+
+  if (type === "api-cache:clear") {
+    event.waitUntil(invalidateApiCache(null).then(() => reply({ ok: true })));
+  } else if (type === "api-cache:invalidate") {
+    event.waitUntil(invalidateApiCache(tables || null).then(() => reply({ ok: true })));
+  } else if (type === "api-cache:stats") {
+    event.waitUntil(getApiCacheStats().then(reply, () => reply(null)));
+  }
+});
+
 self.addEventListener("install", (event) => {
   event.waitUntil(
     caches
@@ -28,7 +395,12 @@ self.addEventListener("activate", (event) => {
 self.addEventListener("fetch", (event) => {
   const url = new URL(event.request.url);
 
-  if (url.pathname.startsWith("/functions/") || url.hostname.includes("supabase")) {
+  if (url.hostname.includes("supabase")) {
+    handleSupabaseRequest(event, url);
+    return;
+  }
+
+  if (url.pathname.startsWith("/functions/")) {
     return;
   }
 
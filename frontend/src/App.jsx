@@ -1,4 +1,4 @@
-import { useState, useEffect, createContext, useContext } from "react";
+import { useState, useEffect, createContext, useContext, Suspense } from "react";
 import "@/App.css";
 import { BrowserRouter, Routes, Route, Navigate, useLocation, useNavigate } from "react-router-dom";
 import { Toaster } from "@/components/ui/sonner";
@@ -8,21 +8,23 @@ import { PasswordChangeModal } from "@/components/PasswordChangeModal";
 import { useIdleTimeout } from "@/hooks/useIdleTimeout";
 import InstallPrompt from "@/components/InstallPrompt";
 import BackupAlert from "@/components/BackupAlert";
-
-// Pages
+// Pages (Login stays in the entry chunk; the rest are split per route in routes.jsx)
 import Login from "@/pages/Login";
-import Dashboard from "@/pages/Dashboard";
-import Sales from "@/pages/Sales";
-import SaleForm from "@/pages/SaleForm";
-import SaleDetail from "@/pages/SaleDetail";
-import Reports from "@/pages/Reports";
-import Users from "@/pages/Users";
-import Partners from "@/pages/Partners";
-import Operators from "@/pages/Operators";
-import CommissionSettings from "@/pages/CommissionSettings";
-import CommissionWizard from "@/pages/CommissionWizard";
-import Leads from "@/pages/Leads";
-import Layout from "@/components/Layout";
+import {
+  Layout,
+  Dashboard,
+  Sales,
+  SaleForm,
+  SaleDetail,
+  Reports,
+  Users,
+  Partners,
+  Operators,
+  CommissionSettings,
+  CommissionWizard,
+  Leads,
+  PageLoader,
+} from "@/routes";
 
 // Auth Context
 const AuthContext = createContext(null);
@@ -170,11 +172,7 @@ const ProtectedRoute = ({ children, requireAdmin = false, requireAdminOrBO = fal
   const location = useLocation();
 
   if (loading) {
-    return (
-      <div className="min-h-screen flex items-center justify-center bg-[#0d474f]">
-        <div className="spinner"></div>
-      </div>
-    );
+    return <PageLoader />;
   }
 
   if (!isAuthenticated) {
@@ -198,60 +196,62 @@ function AppRoutes() {
   const { isAuthenticated } = useAuth();
 
   return (
-    <Routes>
-      <Route path="/login" element={!isAuthenticated ? <Login /> : <Navigate to="/dashboard" replace />} />
+    <Suspense fallback={<PageLoader />}>
+      <Routes>
+        <Route path="/login" element={!isAuthenticated ? <Login /> : <Navigate to="/dashboard" replace />} />
       
-      <Route path="/" element={
-        <ProtectedRoute>
-          <Layout />
-        </ProtectedRoute>
-      }>
-        <Route index element={<Navigate to="/dashboard" replace />} />
-        <Route path="dashboard" element={<Dashboard />} />
-        <Route path="leads" element={<Leads />} />
-        <Route path="sales" element={<Sales />} />
-        <Route path="sales/new" element={<SaleForm />} />
-        <Route path="sales/:id" element={<SaleDetail />} />
-        <Route path="sales/:id/edit" element={<SaleDetail editMode={true} />} />
-        <Route path="partners" element={
-          <ProtectedRoute requireAdminOrBO>
-            <Partners />
-          </ProtectedRoute>
-        } />
-        <Route path="operators" element={
-          <ProtectedRoute requireAdminOrBO>
-            <Operators />
-          </ProtectedRoute>
-        } />
-        <Route path="reports" element={
-          <ProtectedRoute requireAdminOrBO>
-            <Reports />
-          </ProtectedRoute>
-        } />
-        <Route path="users" element={
-          <ProtectedRoute requireAdmin>
-            <Users />
+        <Route path="/" element={
+          <ProtectedRoute>
+            <Layout />
           </ProtectedRoute>
-        } />
-        <Route path="settings/commissions" element={
-          <ProtectedRoute requireAdmin>
-            <CommissionSettings />
-          </ProtectedRoute>
-        } />
-        <Route path="settings/commissions/new" element={
-          <ProtectedRoute requireAdmin>
-            <CommissionWizard />
-          </ProtectedRoute>
-        } />
-        <Route path="settings/commissions/:id" element={
-          <ProtectedRoute requireAdmin>
-            <CommissionWizard />
-          </ProtectedRoute>
-        } />
-      </Route>
-
-      <Route path="*" element={<Navigate to="/dashboard" replace />} />
-    </Routes>
+        }>
+          <Route index element={<Navigate to="/dashboard" replace />} />
+          <Route path="dashboard" element={<Dashboard />} />
+          <Route path="leads" element={<Leads />} />
+          <Route path="sales" element={<Sales />} />
+          <Route path="sales/new" element={<SaleForm />} />
+          <Route path="sales/:id" element={<SaleDetail />} />
+          <Route path="sales/:id/edit" element={<SaleDetail editMode={true} />} />
+          <Route path="partners" element={
+            <ProtectedRoute requireAdminOrBO>
+              <Partners />
+            </ProtectedRoute>
+          } />
+          <Route path="operators" element={
+            <ProtectedRoute requireAdminOrBO>
+              <Operators />
+            </ProtectedRoute>
+          } />
+          <Route path="reports" element={
+            <ProtectedRoute requireAdminOrBO>
+              <Reports />
+            </ProtectedRoute>
+          } />
+          <Route path="users" element={
+            <ProtectedRoute requireAdmin>
+              <Users />
+            </ProtectedRoute>
+          } />
+          <Route path="settings/commissions" element={
+            <ProtectedRoute requireAdmin>
+              <CommissionSettings />
+            </ProtectedRoute>
+          } />
+          <Route path="settings/commissions/new" element={
+            <ProtectedRoute requireAdmin>
+              <CommissionWizard />
+            </ProtectedRoute>
+          } />
+          <Route path="settings/commissions/:id" element={
+            <ProtectedRoute requireAdmin>
+              <CommissionWizard />
+            </ProtectedRoute>
+          } />
+        </Route>
+
+        <Route path="*" element={<Navigate to="/dashboard" replace />} />
+      </Routes>
+    </Suspense>
   );
 }
 
@@ -0,0 +1,111 @@
+import {
+  LineChart,
+  Line,
+  XAxis,
+  YAxis,
+  CartesianGrid,
+  Tooltip,
+  ResponsiveContainer,
+  PieChart,
+  Pie,
+  Cell,
+  Legend
+} from "recharts";
+
+// recharts is only needed once the dashboard draws its charts, so these are
+// loaded lazily by Dashboard instead of being part of the page chunk.
+
+export function MonthlySalesChart({ monthlyStats }) {
+  return (
+    <ResponsiveContainer width="100%" height="100%">
+      <LineChart data={monthlyStats}>
+        <CartesianGrid strokeDasharray="3 3" stroke="rgba(255,255,255,0.1)" />
+        <XAxis
+          dataKey="month"
+          tick={{ fill: 'rgba(255,255,255,0.6)', fontSize: 12 }}
+          axisLine={{ stroke: 'rgba(255,255,255,0.1)' }}
+        />
+        <YAxis
+          tick={{ fill: 'rgba(255,255,255,0.6)', fontSize: 12 }}
+          axisLine={{ stroke: 'rgba(255,255,255,0.1)' }}
+        />
+        <Tooltip
+          content={({ active, payload }) => {
+            if (active && payload && payload.length) {
+              const data = payload[0].payload;
+              const current = data.anoCorrente || 0;
+              const previous = data.anoAnterior || 0;
+              const change = previous > 0 ? ((current - previous) / previous * 100) : (current > 0 ? 100 : 0);
+              const changeText = change >= 0 ? `+${change.toFixed(1)}%` : `${change.toFixed(1)}%`;
+              const changeColor = change >= 0 ? '#4ade80' : '#f87171';
+
+              return (
+                <div className="bg-[#082d32] border border-[#c8f31d]/20 rounded p-3 text-white text-sm">
+                  <p className="font-bold mb-2">{data.month}</p>
+                  <p className="text-[#c8f31d]">Ano Corrente: {current}</p>
+                  <p className="text-[#3b82f6]">Ano Anterior: {previous}</p>
+                  <p style={{ color: changeColor }} className="font-bold mt-1">
+                    {changeText} {change >= 0 ? '↑' : '↓'}
+                  </p>
+                </div>
+              );
+            }
+            return null;
+          }}
+        />
+        <Legend
+          wrapperStyle={{ paddingTop: '20px' }}
+          iconType="line"
+        />
+        <Line
+          type="monotone"
+          dataKey="anoCorrente"
+          stroke="#c8f31d"
+          strokeWidth={3}
+          name="Ano Corrente"
+          dot={{ fill: '#c8f31d', r: 4 }}
+          activeDot={{ r: 6 }}
+        />
+        <Line
+          type="monotone"
+          dataKey="anoAnterior"
+          stroke="#3b82f6"
+          strokeWidth={2}
+          strokeDasharray="5 5"
+          name="Ano Anterior"
+          dot={{ fill: '#3b82f6', r: 3 }}
+        />
+      </LineChart>
+    </ResponsiveContainer>
+  );
+}
+
+export function CategoryPieChart({ categoryData, colors }) {
+  return (
+    <ResponsiveContainer width="100%" height="100%">
+      <PieChart>
+        <Pie
+          data={categoryData}
+          cx="50%"
+          cy="50%"
+          innerRadius={40}
+          outerRadius={80}
+          paddingAngle={5}
+          dataKey="value"
+        >
+          {categoryData.map((entry, index) => (
+            <Cell key={`cell-${index}`} fill={colors[index % colors.length]} />
+          ))}
+        </Pie>
+        <Tooltip 
+          contentStyle={{ 
+            backgroundColor: '#082d32', 
+            border: '1px solid rgba(200,243,29,0.2)',
+            borderRadius: '0.3rem',
+            color: 'white'
+          }}
+        />
+      </PieChart>
+    </ResponsiveContainer>
+  );
+}
@@ -1,6 +1,7 @@
-import { useState } from "react";
+import { useState, Suspense } from "react";
 import { Link, Outlet, useLocation } from "react-router-dom";
 import { useAuth } from "@/App";
+import { prefetchRoute } from "@/routes";
 import {
   LayoutDashboard,
   ShoppingCart,
@@ -104,6 +105,9 @@ export const Layout = () => {
                   key={item.name}
                   to={item.href}
                   onClick={() => setSidebarOpen(false)}
+                  onMouseEnter={() => prefetchRoute(item.href)}
+                  onFocus={() => prefetchRoute(item.href)}
+                  onTouchStart={() => prefetchRoute(item.href)}
                   className={`sidebar-item flex items-center gap-3 px-4 py-3 ${active ? 'active' : ''}`}
                   data-testid={`nav-${item.name.toLowerCase().replace(/\s/g, '-')}`}
                 >
@@ -160,7 +164,15 @@ export const Layout = () => {
 
         {/* Page content */}
         <div className="p-6 animate-fade-in">
-          <Outlet />
+          <Suspense
+            fallback={
+              <div className="flex items-center justify-center py-24">
+                <div className="spinner"></div>
+              </div>
+            }
+          >
+            <Outlet />
+          </Suspense>
         </div>
       </main>
 
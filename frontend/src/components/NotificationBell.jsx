@@ -1,6 +1,10 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { useNavigate } from "react-router-dom";
-import { notificationsService } from "@/services/notificationsService";
+import {
+  notificationsService,
+  mergeNotifications,
+  getNotificationsCursor,
+} from "@/services/notificationsService";
 import { Button } from "@/components/ui/button";
 import {
   Popover,
@@ -18,33 +22,58 @@ export default function NotificationBell({ userId }) {
   const [unreadCount, setUnreadCount] = useState(0);
   const [open, setOpen] = useState(false);
   const [loading, setLoading] = useState(false);
+  const cursorRef = useRef(null);
 
   useEffect(() => {
     if (userId) {
+      cursorRef.current = null;
+      setNotifications([]);
       loadNotifications();
 
       const unsubscribe = notificationsService.subscribeToNotifications(
         userId,
         (newNotification) => {
-          setNotifications((prev) => [newNotification, ...prev]);
-          setUnreadCount((prev) => prev + 1);
+          // The badge follows notification_counters (onUnreadCount) only
+          applyNotifications([newNotification]);
           toast.info(newNotification.title, {
             description: newNotification.message,
           });
+        },
+        {
+          onUnreadCount: setUnreadCount,
+          onReconnect: loadNotifications,
         }
       );
 
-      return () => unsubscribe();
+      const handleVisibilityChange = () => {
+        if (document.visibilityState === "visible") {
+          loadNotifications();
+        }
+      };
+      document.addEventListener("visibilitychange", handleVisibilityChange);
+
+      return () => {
+        unsubscribe();
+        document.removeEventListener("visibilitychange", handleVisibilityChange);
+      };
     }
   }, [userId]);
 
+  const applyNotifications = (incoming) => {
+    setNotifications((prev) => {
+      const merged = mergeNotifications(prev, incoming);
+      cursorRef.current = getNotificationsCursor(merged);
+      return merged;
+    });
+  };
+
   const loadNotifications = async () => {
     try {
       const [notifs, count] = await Promise.all([
-        notificationsService.getNotifications(userId),
+        notificationsService.getNotificationsSince(userId, cursorRef.current),
         notificationsService.getUnreadCount(userId),
       ]);
-      setNotifications(notifs);
+      applyNotifications(notifs);
       setUnreadCount(count);
     } catch (error) {
       console.error("Error loading notifications:", error);
@@ -0,0 +1,91 @@
+// Client side of the API read cache implemented in public/sw.js
+
+function postToSW(message) {
+  const controller = navigator.serviceWorker?.controller;
+  if (!controller) return Promise.resolve(null);
+
+  return new Promise((resolve) => {
+    const channel = new MessageChannel();
+    const timeout = setTimeout(() => resolve(null), 5000);
+    channel.port1.onmessage = (event) => {
+      clearTimeout(timeout);
+      resolve(event.data);
+    };
+    controller.postMessage(message, [channel.port2]);
+  });
+}
+
+async function timeReads(reads) {
+  const results = {};
+  const started = performance.now();
+  for (const [name, read] of Object.entries(reads)) {
+    const t0 = performance.now();
+    try {
+      await read();
+      results[name] = Math.round(performance.now() - t0);
+    } catch (e) {
+      results[name] = null;
+    }
+  }
+  results.total = Math.round(performance.now() - started);
+  return results;
+}
+
+export const apiCache = {
+  isActive() {
+    return Boolean(navigator.serviceWorker?.controller);
+  },
+
+  clear() {
+    return postToSW({ type: "api-cache:clear" });
+  },
+
+  invalidate(tables) {
+    return postToSW({ type: "api-cache:invalidate", tables });
+  },
+
+  getStats() {
+    return postToSW({ type: "api-cache:stats" });
+  },
+
+  // Cold start (empty cache) vs warm start (cache populated by the cold pass)
+  // for the reads the app issues when it opens. Clears the cache first. Run
+  // from the console with `await window.__apiCacheBenchmark()`, which is only
+  // installed in dev builds or with VITE_API_CACHE_BENCHMARK=true.
+  async runBenchmark() {
+    if (!this.isActive()) {
+      console.warn("API cache benchmark requires an active service worker");
+      return null;
+    }
+
+    const [{ partnersService }, { operatorsService }, { salesService }, { usersService }] =
+      await Promise.all([
+        import("@/services/partnersService"),
+        import("@/services/operatorsService"),
+        import("@/services/salesService"),
+        import("@/services/usersService"),
+      ]);
+
+    const reads = {
+      partners: () => partnersService.getPartners(),
+      operators: () => operatorsService.getOperators(),
+      sales: () => salesService.getSales(),
+      users: () => usersService.getUsers(),
+    };
+
+    await this.clear();
+    const cold = await timeReads(reads);
+    const warm = await timeReads(reads);
+    const stats = await this.getStats();
+
+    const report = Object.keys(cold).map((name) => ({
+      request: name,
+      cold_ms: cold[name],
+      warm_ms: warm[name],
+      speedup: cold[name] && warm[name] ? `${(cold[name] / warm[name]).toFixed(1)}x` : "-",
+    }));
+    console.table(report);
+
+    return { cold, warm, stats };
+  },
+};
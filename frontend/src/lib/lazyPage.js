@@ -0,0 +1,21 @@
+import { lazy } from "react";
+
+// React.lazy wrapper that can also be triggered ahead of render, so a route
+// chunk starts downloading when the user hovers or touches its link.
+export function lazyPage(loader) {
+  let promise = null;
+
+  const load = () => {
+    if (!promise) {
+      promise = loader().catch((error) => {
+        promise = null;
+        throw error;
+      });
+    }
+    return promise;
+  };
+
+  const Component = lazy(load);
+  Component.preload = load;
+  return Component;
+}
@@ -3,11 +3,17 @@ import ReactDOM from "react-dom/client";
 import "@/index.css";
 import App from "@/App.jsx";
 import { pushManager } from "@/lib/pushManager";
+import { apiCache } from "@/lib/apiCache";
 
 if ("serviceWorker" in navigator) {
   window.addEventListener("load", () => {
     pushManager.registerSW();
   });
+
+  // Debug hook (clears the API cache when run): dev builds or explicit opt-in only
+  if (import.meta.env.DEV || import.meta.env.VITE_API_CACHE_BENCHMARK === "true") {
+    window.__apiCacheBenchmark = () => apiCache.runBenchmark();
+  }
 }
 
 ReactDOM.createRoot(document.getElementById("root")).render(
@@ -21,7 +21,6 @@ import {
   Filter,
   Loader2
 } from "lucide-react";
-import * as XLSX from 'xlsx';
 import { format } from 'date-fns';
 
 const STATUS_MAP = {
@@ -126,12 +125,21 @@ export default function Reports() {
     }
   };
 
-  const exportToExcel = () => {
+  const exportToExcel = async () => {
     if (!report || !report.sales.length) {
       toast.error("Sem dados para exportar");
       return;
     }
 
+    let XLSX;
+    try {
+      // xlsx só é descarregado quando o utilizador exporta
+      XLSX = await import('xlsx');
+    } catch (error) {
+      toast.error("Erro ao exportar relatório");
+      return;
+    }
+
     const worksheetData = [
       [
         "Cliente", "NIF", "Categoria", "Tipo", "Parceiro",
@@ -1,6 +1,6 @@
 import { useState, useEffect, useCallback } from "react";
 import { useAuth } from "@/App";
-import { useNavigate, useParams } from "react-router-dom";
+import { Link, useNavigate, useParams } from "react-router-dom";
 import { salesService } from "@/services/salesService";
 import { partnersService } from "@/services/partnersService";
 import { usersService } from "@/services/usersService";
@@ -37,7 +37,8 @@ import {
   Sun,
   AlertTriangle,
   Save,
-  Loader2
+  Loader2,
+  History
 } from "lucide-react";
 
 const STATUS_MAP = {
@@ -141,10 +142,11 @@ export default function SaleDetail({ editMode = false }) {
   const [commissionType, setCommissionType] = useState("manual");
   const [isEditing, setIsEditing] = useState(editMode);
   const [recalculating, setRecalculating] = useState(false);
+  const [editOptionsLoaded, setEditOptionsLoaded] = useState(false);
 
   const fetchSale = useCallback(async () => {
     try {
-      const saleData = await salesService.getSaleById(id);
+      const saleData = await salesService.getSaleDetail(id);
       setSale(saleData);
       setEditCommissionSeller(saleData.commission_seller?.toString() || "");
       setEditCommissionPartner(saleData.commission_partner?.toString() || "");
@@ -307,7 +309,7 @@ export default function SaleDetail({ editMode = false }) {
       };
 
       const updated = await salesService.updateSale(sale.id, updatePayload);
-      setSale(updated);
+      setSale((prev) => ({ ...prev, ...updated }));
       setEditCommissionSeller(updated.commission_seller?.toString() || "0");
       setEditCommissionPartner(updated.commission_partner?.toString() || "0");
 
@@ -322,11 +324,18 @@ export default function SaleDetail({ editMode = false }) {
 
   useEffect(() => {
     fetchSale();
-    fetchPartners();
-    fetchSellers();
-    fetchOperators();
   }, [fetchSale]);
 
+  // Partner/seller/operator lists only feed the edit form
+  useEffect(() => {
+    if (isEditing && !editOptionsLoaded) {
+      setEditOptionsLoaded(true);
+      fetchPartners();
+      fetchSellers();
+      fetchOperators();
+    }
+  }, [isEditing, editOptionsLoaded]);
+
   useEffect(() => {
     if (editOperatorId && isEditing) {
       const filteredPartners = getFilteredPartners();
@@ -415,8 +424,8 @@ export default function SaleDetail({ editMode = false }) {
         }
       }
 
-      const updated = await salesService.updateSale(id, payload);
-      setSale(updated);
+      await salesService.updateSale(id, payload);
+      await fetchSale();
       setIsEditing(false);
       toast.success("Venda atualizada com sucesso");
     } catch (error) {
@@ -1159,6 +1168,12 @@ export default function SaleDetail({ editMode = false }) {
               <p className="text-white/50 text-sm mb-1">Vendedor</p>
               <p className="text-white">{sale.seller_name}</p>
             </div>
+            {sale.client_category_name && (
+              <div>
+                <p className="text-white/50 text-sm mb-1">Categoria de Cliente</p>
+                <p className="text-white">{sale.client_category_name}</p>
+              </div>
+            )}
             <div>
               <p className="text-white/50 text-sm mb-1 flex items-center gap-1">
                 <Clock size={14} /> Prazo Fidelização
@@ -1243,6 +1258,54 @@ export default function SaleDetail({ editMode = false }) {
           )}
         </CardContent>
       </Card>
+
+      {/* Other contracts for the same NIF */}
+      {sale.client_contracts?.length > 0 && (
+        <Card className="card-leiritrix" data-testid="client-contracts">
+          <CardHeader className="border-b border-white/5 pb-4">
+            <CardTitle className="text-white font-['Manrope'] text-lg flex items-center gap-2">
+              <History size={20} className="text-[#c8f31d]" />
+              Outros Contratos do Cliente
+            </CardTitle>
+          </CardHeader>
+          <CardContent className="pt-6">
+            <div className="divide-y divide-white/5">
+              {sale.client_contracts.map((contract) => (
+                <Link
+                  key={contract.id}
+                  to={`/sales/${contract.id}`}
+                  className="flex items-center justify-between gap-4 py-3 hover:bg-white/5 px-2 rounded"
+                >
+                  <div>
+                    <p className="text-white">
+                      {CATEGORY_MAP[contract.category]?.label || contract.category}
+                      {contract.operator_name && (
+                        <span className="text-white/50"> · {contract.operator_name}</span>
+                      )}
+                    </p>
+                    <p className="text-white/50 text-sm">
+                      {TYPE_MAP[contract.sale_type] || "-"} ·{" "}
+                      {new Date(contract.sale_date || contract.created_at).toLocaleDateString('pt-PT')}
+                    </p>
+                  </div>
+                  <Badge className={`${STATUS_MAP[contract.status]?.color} border`}>
+                    {STATUS_MAP[contract.status]?.label}
+                  </Badge>
+                </Link>
+              ))}
+            </div>
+            {sale.client_contracts_has_more && (
+              <Link
+                to={`/sales?nif=${encodeURIComponent(sale.client_nif)}`}
+                className="inline-block mt-4 text-sm text-[#c8f31d] hover:underline"
+                data-testid="client-contracts-view-all"
+              >
+                Ver todos
+              </Link>
+            )}
+          </CardContent>
+        </Card>
+      )}
     </div>
   );
 }
@@ -1,6 +1,7 @@
 import { useState, useEffect, useCallback } from "react";
 import { useAuth } from "@/App";
-import { Link } from "react-router-dom";
+import { prefetchRoute } from "@/routes";
+import { Link, useSearchParams } from "react-router-dom";
 import { salesService } from "@/services/salesService";
 import { partnersService } from "@/services/partnersService";
 import { operatorsService } from "@/services/operatorsService";
@@ -76,8 +77,12 @@ export default function Sales() {
   const [loading, setLoading] = useState(true);
   const [exporting, setExporting] = useState(false);
 
-  const [searchType, setSearchType] = useState("none");
-  const [searchText, setSearchText] = useState("");
+  // `/sales?nif=...` (e.g. "Ver todos" on a sale's client contracts) opens
+  // with the NIF search applied
+  const [searchParams] = useSearchParams();
+  const initialNif = searchParams.get("nif") || "";
+  const [searchType, setSearchType] = useState(initialNif ? "nif" : "none");
+  const [searchText, setSearchText] = useState(initialNif);
   const [statusFilter, setStatusFilter] = useState("all");
   const [categoryFilter, setCategoryFilter] = useState("all");
   const [partnerFilter, setPartnerFilter] = useState("all");
@@ -86,7 +91,7 @@ export default function Sales() {
   const [dateFrom, setDateFrom] = useState(null);
   const [dateTo, setDateTo] = useState(null);
 
-  const [showFilters, setShowFilters] = useState(false);
+  const [showFilters, setShowFilters] = useState(Boolean(initialNif));
   const [deleteId, setDeleteId] = useState(null);
   const [currentPage, setCurrentPage] = useState(1);
   const [sortColumn, setSortColumn] = useState("sale_date");
@@ -628,7 +633,12 @@ export default function Sales() {
                       </td>
                       <td>
                         <div className="flex items-center justify-end gap-1">
-                          <Link to={`/sales/${sale.id}`}>
+                          <Link
+                            to={`/sales/${sale.id}`}
+                            onMouseEnter={() => prefetchRoute(`/sales/${sale.id}`)}
+                            onFocus={() => prefetchRoute(`/sales/${sale.id}`)}
+                            onTouchStart={() => prefetchRoute(`/sales/${sale.id}`)}
+                          >
                             <Button 
                               variant="ghost" 
                               size="sm" 
@@ -638,7 +648,12 @@ export default function Sales() {
                               <Eye size={16} />
                             </Button>
                           </Link>
-                          <Link to={`/sales/${sale.id}/edit`}>
+                          <Link
+                            to={`/sales/${sale.id}/edit`}
+                            onMouseEnter={() => prefetchRoute(`/sales/${sale.id}`)}
+                            onFocus={() => prefetchRoute(`/sales/${sale.id}`)}
+                            onTouchStart={() => prefetchRoute(`/sales/${sale.id}`)}
+                          >
                             <Button 
                               variant="ghost" 
                               size="sm" 
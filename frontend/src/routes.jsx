@@ -0,0 +1,40 @@
+import { lazyPage } from "@/lib/lazyPage";
+
+// Route-level code splitting. Kept out of App.jsx so pages and Layout can
+// prefetch routes without importing back into the root module.
+export const Layout = lazyPage(() => import("@/components/Layout"));
+export const Dashboard = lazyPage(() => import("@/pages/Dashboard"));
+export const Sales = lazyPage(() => import("@/pages/Sales"));
+export const SaleForm = lazyPage(() => import("@/pages/SaleForm"));
+export const SaleDetail = lazyPage(() => import("@/pages/SaleDetail"));
+export const Reports = lazyPage(() => import("@/pages/Reports"));
+export const Users = lazyPage(() => import("@/pages/Users"));
+export const Partners = lazyPage(() => import("@/pages/Partners"));
+export const Operators = lazyPage(() => import("@/pages/Operators"));
+export const CommissionSettings = lazyPage(() => import("@/pages/CommissionSettings"));
+export const CommissionWizard = lazyPage(() => import("@/pages/CommissionWizard"));
+export const Leads = lazyPage(() => import("@/pages/Leads"));
+
+const ROUTE_PAGES = {
+  "/dashboard": Dashboard,
+  "/leads": Leads,
+  "/sales": Sales,
+  "/sales/new": SaleForm,
+  "/partners": Partners,
+  "/operators": Operators,
+  "/reports": Reports,
+  "/users": Users,
+  "/settings/commissions": CommissionSettings,
+};
+
+// Start downloading a route's chunk before navigation (hover / focus / touch)
+export const prefetchRoute = (href) => {
+  const page = ROUTE_PAGES[href] || (href.startsWith("/sales/") ? SaleDetail : null);
+  page?.preload().catch(() => {});
+};
+
+export const PageLoader = () => (
+  <div className="min-h-screen flex items-center justify-center bg-[#0d474f]">
+    <div className="spinner"></div>
+  </div>
+);
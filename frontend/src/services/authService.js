@@ -1,5 +1,6 @@
 import { supabase } from '@/lib/supabase';
 import { emailValidator } from '@/utils/emailValidator';
+import { apiCache } from '@/lib/apiCache';
 
 export const authService = {
   async signIn(email, password) {
@@ -86,6 +87,9 @@ export const authService = {
     try {
       console.log('[AuthService] Iniciando signOut no Supabase...');
 
+      // Limpar respostas da API guardadas pelo service worker neste dispositivo
+      await apiCache.clear();
+
       // Fazer logout usando o escopo 'local' para limpar apenas o dispositivo atual
       const { error } = await supabase.auth.signOut({ scope: 'local' });
 
@@ -1,5 +1,4 @@
 import { supabase } from '@/lib/supabase';
-import * as XLSX from 'xlsx';
 
 const STATUS_LABELS = {
   em_negociacao: 'Em Negociacao',
@@ -114,6 +113,9 @@ export const backupsService = {
       'Notas': sale.notes || '',
     }));
 
+    // Loaded on demand so xlsx stays out of the startup bundle
+    const XLSX = await import('xlsx');
+
     const ws = XLSX.utils.json_to_sheet(rows);
 
     const colWidths = Object.keys(rows[0] || {}).map((key) => ({
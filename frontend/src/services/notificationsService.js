@@ -1,26 +1,50 @@
 import { supabase } from "@/lib/supabase";
 
+export const NOTIFICATIONS_PAGE_SIZE = 100;
+
 export const notificationsService = {
-  async getNotifications(userId) {
+  async getNotifications(userId, limit = NOTIFICATIONS_PAGE_SIZE) {
     const { data, error } = await supabase
       .from("notifications")
       .select("*")
       .eq("user_id", userId)
-      .order("created_at", { ascending: false });
+      .order("created_at", { ascending: false })
+      .limit(limit);
 
     if (error) throw error;
     return data || [];
   },
 
-  async getUnreadCount(userId) {
-    const { count, error } = await supabase
+  // Delta sync: only rows created at or after the client's cursor.
+  // Uses gte so rows sharing the cursor timestamp are not lost; callers
+  // dedupe by id (see mergeNotifications).
+  async getNotificationsSince(userId, cursor, limit = NOTIFICATIONS_PAGE_SIZE) {
+    if (!cursor) {
+      return this.getNotifications(userId, limit);
+    }
+
+    const { data, error } = await supabase
       .from("notifications")
-      .select("*", { count: "exact", head: true })
+      .select("*")
       .eq("user_id", userId)
-      .eq("read", false);
+      .gte("created_at", cursor)
+      .order("created_at", { ascending: false })
+      .limit(limit);
+
+    if (error) throw error;
+    return data || [];
+  },
+
+  // Reads the trigger-maintained counter instead of counting rows
+  async getUnreadCount(userId) {
+    const { data, error } = await supabase
+      .from("notification_counters")
+      .select("unread_count")
+      .eq("user_id", userId)
+      .maybeSingle();
 
     if (error) throw error;
-    return count || 0;
+    return data?.unread_count || 0;
   },
 
   async markAsRead(notificationId) {
@@ -128,8 +152,10 @@ export const notificationsService = {
     return notifications;
   },
 
-  subscribeToNotifications(userId, callback) {
-    const channel = supabase
+  subscribeToNotifications(userId, callback, { onUnreadCount, onReconnect } = {}) {
+    let hasSubscribed = false;
+
+    let channel = supabase
       .channel(`notifications:${userId}`)
       .on(
         "postgres_changes",
@@ -142,11 +168,55 @@ export const notificationsService = {
         (payload) => {
           callback(payload.new);
         }
-      )
-      .subscribe();
+      );
+
+    if (onUnreadCount) {
+      channel = channel.on(
+        "postgres_changes",
+        {
+          event: "*",
+          schema: "public",
+          table: "notification_counters",
+          filter: `user_id=eq.${userId}`
+        },
+        (payload) => {
+          onUnreadCount(payload.new?.unread_count || 0);
+        }
+      );
+    }
+
+    channel.subscribe((status) => {
+      if (status !== "SUBSCRIBED") return;
+      // Inserts made while the socket was down are not replayed by realtime,
+      // so let the caller catch up with a delta fetch.
+      if (hasSubscribed && onReconnect) {
+        onReconnect();
+      }
+      hasSubscribed = true;
+    });
 
     return () => {
       supabase.removeChannel(channel);
     };
   }
 };
+
+export function mergeNotifications(current, incoming) {
+  if (!incoming || incoming.length === 0) return current;
+
+  const byId = new Map(current.map((n) => [n.id, n]));
+  for (const notification of incoming) {
+    byId.set(notification.id, notification);
+  }
+
+  return Array.from(byId.values())
+    .sort((a, b) => new Date(b.created_at) - new Date(a.created_at))
+    .slice(0, NOTIFICATIONS_PAGE_SIZE);
+}
+
+export function getNotificationsCursor(notifications) {
+  return notifications.reduce(
+    (latest, n) => (!latest || n.created_at > latest ? n.created_at : latest),
+    null
+  );
+}
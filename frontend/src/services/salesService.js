@@ -1,6 +1,44 @@
 import { supabase } from '@/lib/supabase';
 import { notificationsService } from './notificationsService';
 
+// Related entities that getSaleDetail can embed in the same request
+const SALE_DETAIL_RELATIONS = {
+  operator: `operators:operator_id (
+    id,
+    name,
+    commission_visible_to_bo
+  )`,
+  partner: `partners:partner_id (
+    id,
+    name
+  )`,
+  seller: `users:seller_id (
+    id,
+    name
+  )`,
+  client_category: `operator_client_categories:client_category_id (
+    id,
+    name
+  )`,
+  client_contracts: `client_contracts (
+    id,
+    client_name,
+    category,
+    sale_type,
+    status,
+    sale_date,
+    created_at,
+    loyalty_end_date,
+    operators:operator_id (
+      id,
+      name
+    )
+  )`
+};
+
+// Embedded client history is capped; the detail page links to the full list
+export const CLIENT_CONTRACTS_LIMIT = 5;
+
 export const salesService = {
   async getSales(sellerId = null, filters = {}) {
     let query = supabase
@@ -100,6 +138,70 @@ export const salesService = {
     return data;
   },
 
+  // Sale with operator, partner, seller, client category and the client's
+  // other contracts (same NIF) in a single request. `fields` narrows the sale
+  // columns and `include` the embedded relations (keys of SALE_DETAIL_RELATIONS).
+  // Only the newest `contractsLimit` contracts are embedded;
+  // `client_contracts_has_more` tells whether there are others.
+  async getSaleDetail(
+    saleId,
+    {
+      fields = ['*'],
+      include = Object.keys(SALE_DETAIL_RELATIONS),
+      contractsLimit = CLIENT_CONTRACTS_LIMIT
+    } = {}
+  ) {
+    const relations = include
+      .filter((key) => SALE_DETAIL_RELATIONS[key])
+      .map((key) => SALE_DETAIL_RELATIONS[key]);
+
+    let query = supabase
+      .from('sales')
+      .select([...fields, ...relations].join(','))
+      .eq('id', saleId);
+
+    if (include.includes('client_contracts')) {
+      // One extra row to detect whether the history was truncated
+      query = query
+        .order('created_at', { referencedTable: 'client_contracts', ascending: false })
+        .limit(contractsLimit + 1, { referencedTable: 'client_contracts' });
+    }
+
+    const { data, error } = await query.maybeSingle();
+
+    if (error) throw error;
+    if (!data) return data;
+
+    const detail = { ...data };
+
+    // Only derive values whose sources were selected, so callers can tell
+    // "not included" (undefined) from "empty" ('' / 0)
+    if ('commission_seller' in data || 'commission_partner' in data || 'commission_backoffice' in data) {
+      detail.commission =
+        (data.commission_seller || 0) +
+        (data.commission_partner || 0) +
+        (data.commission_backoffice || 0);
+    }
+    if ('partners' in data) {
+      detail.partner_name = data.partners?.name || '';
+    }
+    if ('users' in data) {
+      detail.seller_name = data.users?.name || '';
+    }
+    if ('operator_client_categories' in data) {
+      detail.client_category_name = data.operator_client_categories?.name || '';
+    }
+    if (data.client_contracts) {
+      detail.client_contracts = data.client_contracts.slice(0, contractsLimit).map(contract => ({
+        ...contract,
+        operator_name: contract.operators?.name || ''
+      }));
+      detail.client_contracts_has_more = data.client_contracts.length > contractsLimit;
+    }
+
+    return detail;
+  },
+
   async createSale(saleData) {
     const { data, error } = await supabase
       .from('sales')
@@ -1,12 +1,13 @@
 import { defineConfig, loadEnv } from 'vite'
 import react from '@vitejs/plugin-react'
 import path from 'path'
+import bundleBudget from './plugins/bundleBudget.js'
 
 export default defineConfig(({ mode }) => {
   const env = loadEnv(mode, path.resolve(__dirname, '..'), '')
 
   return {
-    plugins: [react()],
+    plugins: [react(), bundleBudget()],
     resolve: {
       alias: {
         '@': path.resolve(__dirname, './src'),
@@ -33,7 +34,6 @@ export default defineConfig(({ mode }) => {
       rollupOptions: {
         output: {
           manualChunks: {
-            recharts: ['recharts'],
             'ui-components': [
               '@/components/ui/card',
               '@/components/ui/button',
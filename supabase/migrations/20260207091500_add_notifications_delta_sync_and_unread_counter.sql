@@ -0,0 +1,172 @@
+/*
+  # Notifications delta sync and maintained unread counter
+
+  The notification bell used to re-read the whole `notifications` list and
+  count unread rows on every refresh. Clients now keep a `created_at` cursor
+  and only fetch rows newer than it, and the badge reads a single counter row.
+
+  1. Indexes
+    - `idx_notifications_user_created_at` on (user_id, created_at DESC) so the
+      per-user delta query is an index range scan
+
+  2. New Tables
+    - `notification_counters`
+      - `user_id` (uuid, primary key, references users)
+      - `unread_count` (integer) - number of unread notifications
+      - `updated_at` (timestamptz)
+
+  3. Triggers
+    - `trigger_notification_counters_{insert,update,delete}` keep
+      `unread_count` in sync on `notifications`. They are statement-level
+      triggers over transition tables, so a bulk update applies a single
+      aggregated delta (and a single realtime event) per user
+
+  4. Security
+    - Enable RLS on `notification_counters`
+    - Users can only read their own counter (writes happen via the trigger)
+    - EXECUTE on `adjust_notification_counter` is revoked from API roles
+
+  5. Realtime
+    - Add `notifications` and `notification_counters` to supabase_realtime
+*/
+
+CREATE INDEX IF NOT EXISTS idx_notifications_user_created_at
+  ON notifications(user_id, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS notification_counters (
+  user_id uuid PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+  unread_count integer NOT NULL DEFAULT 0 CHECK (unread_count >= 0),
+  updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+ALTER TABLE notification_counters ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own notification counter"
+  ON notification_counters FOR SELECT
+  TO authenticated
+  USING (auth.uid() = user_id);
+
+-- Adjust a user's unread counter by delta, creating the row if needed
+CREATE OR REPLACE FUNCTION adjust_notification_counter(p_user_id uuid, p_delta integer)
+RETURNS void
+SECURITY DEFINER
+SET search_path = public
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF p_user_id IS NULL OR p_delta = 0 THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO notification_counters (user_id, unread_count, updated_at)
+  VALUES (p_user_id, GREATEST(p_delta, 0), now())
+  ON CONFLICT (user_id) DO UPDATE
+    SET unread_count = GREATEST(notification_counters.unread_count + p_delta, 0),
+        updated_at = now();
+END;
+$$;
+
+-- Only the trigger may adjust counters; keep it out of the PostgREST RPC surface
+REVOKE EXECUTE ON FUNCTION adjust_notification_counter(uuid, integer) FROM PUBLIC, anon, authenticated;
+
+-- Statement-level so a bulk update (e.g. "mark all as read") applies one
+-- aggregated delta per user instead of one counter upsert per row
+CREATE OR REPLACE FUNCTION maintain_notification_counters()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM adjust_notification_counter(d.user_id, d.delta)
+    FROM (
+      SELECT user_id, COUNT(*)::integer AS delta
+      FROM new_rows
+      WHERE NOT COALESCE(read, false)
+      GROUP BY user_id
+    ) d;
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM adjust_notification_counter(d.user_id, d.delta)
+    FROM (
+      SELECT user_id, -COUNT(*)::integer AS delta
+      FROM old_rows
+      WHERE NOT COALESCE(read, false)
+      GROUP BY user_id
+    ) d;
+  ELSE
+    PERFORM adjust_notification_counter(d.user_id, d.delta)
+    FROM (
+      SELECT changes.user_id, SUM(changes.delta)::integer AS delta
+      FROM (
+        SELECT user_id, -1 AS delta FROM old_rows WHERE NOT COALESCE(read, false)
+        UNION ALL
+        SELECT user_id, 1 AS delta FROM new_rows WHERE NOT COALESCE(read, false)
+      ) changes
+      GROUP BY changes.user_id
+      HAVING SUM(changes.delta) <> 0
+    ) d;
+  END IF;
+
+  RETURN NULL;
+END;
+$$;
+
+-- Transition tables cannot be combined with several events or a column list,
+-- so each operation gets its own trigger
+DROP TRIGGER IF EXISTS trigger_notification_counters ON notifications;
+DROP TRIGGER IF EXISTS trigger_notification_counters_insert ON notifications;
+DROP TRIGGER IF EXISTS trigger_notification_counters_update ON notifications;
+DROP TRIGGER IF EXISTS trigger_notification_counters_delete ON notifications;
+
+CREATE TRIGGER trigger_notification_counters_insert
+  AFTER INSERT ON notifications
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION maintain_notification_counters();
+
+CREATE TRIGGER trigger_notification_counters_update
+  AFTER UPDATE ON notifications
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION maintain_notification_counters();
+
+CREATE TRIGGER trigger_notification_counters_delete
+  AFTER DELETE ON notifications
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION maintain_notification_counters();
+
+-- Backfill counters from existing notifications
+INSERT INTO notification_counters (user_id, unread_count, updated_at)
+SELECT user_id, COUNT(*), now()
+FROM notifications
+WHERE NOT COALESCE(read, false)
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE
+  SET unread_count = EXCLUDED.unread_count,
+      updated_at = now();
+
+-- Expose both tables to realtime if the publication exists
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM pg_publication WHERE pubname = 'supabase_realtime'
+  ) THEN
+    IF NOT EXISTS (
+      SELECT 1 FROM pg_publication_tables
+      WHERE pubname = 'supabase_realtime' AND tablename = 'notifications'
+    ) THEN
+      ALTER PUBLICATION supabase_realtime ADD TABLE notifications;
+    END IF;
+
+    IF NOT EXISTS (
+      SELECT 1 FROM pg_publication_tables
+      WHERE pubname = 'supabase_realtime' AND tablename = 'notification_counters'
+    ) THEN
+      ALTER PUBLICATION supabase_realtime ADD TABLE notification_counters;
+    END IF;
+  END IF;
+END $$;
+
+NOTIFY pgrst, 'reload schema';
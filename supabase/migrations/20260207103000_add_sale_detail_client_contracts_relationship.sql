@@ -0,0 +1,37 @@
+/*
+  # Sale detail aggregate: client contracts relationship
+
+  Opening a sale used to need one request for the sale and another for the
+  client's other contracts (by NIF). Exposing the NIF history as a PostgREST
+  computed relationship lets a single `sales` select embed it next to the
+  operator, partner, seller and client category.
+
+  1. Functions
+    - `client_contracts(sales)` - other sales with the same `client_nif`,
+      newest first. Ignores empty and placeholder ('000000000') NIFs.
+      Runs as the caller, so sales RLS policies still apply. Callers cap the
+      embed (`client_contracts.limit`), so a NIF with hundreds of contracts
+      does not turn every sale open into an unbounded payload.
+
+  2. Indexes
+    - `idx_sales_client_nif_created_at` on sales(client_nif, created_at DESC)
+      so the newest N contracts for a NIF are an index range scan
+*/
+
+CREATE INDEX IF NOT EXISTS idx_sales_client_nif_created_at
+  ON sales(client_nif, created_at DESC);
+
+CREATE OR REPLACE FUNCTION client_contracts(sales)
+RETURNS SETOF sales
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT s.*
+  FROM sales s
+  WHERE s.client_nif = $1.client_nif
+    AND s.id <> $1.id
+    AND $1.client_nif NOT IN ('', '000000000')
+  ORDER BY s.created_at DESC;
+$$;
+
+NOTIFY pgrst, 'reload schema';